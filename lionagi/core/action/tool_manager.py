@@ -22,7 +22,8 @@ strings, or specialized objects.
 """
 
 import inspect
-from functools import singledispatchmethod
+from copy import deepcopy
+from functools import lru_cache, singledispatchmethod
 from typing import Any, Callable, List, Union, Tuple
 from lionagi.libs import ParseUtil
 from lionagi.libs.ln_convert import to_list, to_dict
@@ -277,16 +278,44 @@ class ToolManager(Actionable):
             ValueError: If the response is not a valid function call.
         """
         try:
-            func = response["action"][7:]
-            args = to_dict(response["arguments"])
-            return func, args
-        except Exception:
-            try:
-                func = response["recipient_name"].split(".")[-1]
-                args = response["parameters"]
-                return func, args
-            except:
-                raise ValueError("response is not a valid function call")
+            if "action" in response:
+                return response["action"][7:], to_dict(response["arguments"])
+            if "recipient_name" in response:
+                func = response["recipient_name"].rpartition(".")[2]
+                return func, response["parameters"]
+        except Exception as e:
+            raise ValueError("response is not a valid function call") from e
+        raise ValueError("response is not a valid function call")
+
+
+@lru_cache(maxsize=1024)
+def _cached_schema(func: Callable, style: str) -> dict:
+    return ParseUtil._func_to_schema(func, style=style)
+
+
+def _is_cacheable(func: Callable) -> bool:
+    return (
+        inspect.isfunction(func)
+        and func.__closure__ is None
+        and "<locals>" not in func.__qualname__
+    )
+
+
+def _schema_for(func: Callable, style: str) -> dict:
+    """
+    Returns the tool schema for a function, parsing each (function, style)
+    pair only once. A copy is returned since tool schemas may be edited
+    after creation.
+
+    Only module-level functions are cached; bound methods, closures and
+    callable instances would keep their owners alive in the cache.
+    """
+    if not _is_cacheable(func):
+        return ParseUtil._func_to_schema(func, style=style)
+    try:
+        return deepcopy(_cached_schema(func, style))
+    except TypeError:  # unhashable callable
+        return ParseUtil._func_to_schema(func, style=style)
 
 
 def func_to_tool(
@@ -323,9 +352,10 @@ def func_to_tool(
         # Convert multiple functions with multiple parsers
         tools = func_to_tool([func_one, func_two], [parser_one, parser_two])
     """
-    fs = []
-    funcs = to_list(func_, flatten=True, dropna=True)
-    parsers = to_list(parser, flatten=True, dropna=True)
+    funcs = list(func_) if isinstance(func_, (list, tuple)) else [func_]
+    funcs = [f for f in funcs if f is not None]
+    parsers = list(parser) if isinstance(parser, (list, tuple)) else [parser]
+    parsers = [p for p in parsers if p is not None]
 
     if parser:
         if len(funcs) != len(parsers) != 1:
@@ -333,22 +363,22 @@ def func_to_tool(
                 "Length of parser must match length of func. Except if you only pass one"
             )
 
-        for idx in range(len(funcs)):
-            f_ = lambda _f: Tool(
+        fs = [
+            Tool(
                 function=_f,
-                schema_=ParseUtil._func_to_schema(_f, style=docstring_style),
+                schema_=_schema_for(_f, docstring_style),
                 parser=parsers[idx] if len(parsers) > 1 else parsers[0],
                 **kwargs,
             )
-
-            fs.append(f_)
+            for idx, _f in enumerate(funcs)
+        ]
 
     else:
         fs = lcall(
             funcs,
             lambda _f: Tool(
                 function=_f,
-                schema_=ParseUtil._func_to_schema(_f, style=docstring_style),
+                schema_=_schema_for(_f, docstring_style),
                 **kwargs,
             ),
         )
@@ -19,16 +19,16 @@ limitations under the License.
 from abc import ABC
 import contextlib
 from collections.abc import Sequence
-from functools import singledispatchmethod
+from functools import lru_cache, singledispatchmethod
 from typing import Any, TypeVar, Type, TypeAlias, Union
 
 from pandas import DataFrame, Series
-from pydantic import BaseModel, Field, ValidationError, AliasChoices
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, AliasChoices
+from pydantic_core import PydanticUndefined
 
 from lionagi.libs import ParseUtil, SysUtil
 from lionagi.libs.ln_convert import strip_lower, to_dict, to_str
-from lionagi.libs.ln_func_call import lcall
-from lionagi.libs.ln_nested import nget, nset, ninsert, flatten, unflatten
+from lionagi.libs.ln_nested import nget, nset, ninsert
 
 from .exceptions import FieldError, LionTypeError, LionValueError
 from .util import base_lion_fields, llama_meta_fields, lc_meta_fields
@@ -38,6 +38,21 @@ T = TypeVar("T")
 _init_class = {}
 
 
+def _creation_timestamp() -> str:
+    """UTC ISO timestamp with the "+00:00" offset dropped."""
+    return SysUtil.get_timestamp(sep=None)[:-6]
+
+
+# resolved by name on the calling class so subclass overrides apply
+_FROM_OBJ_HANDLERS = {
+    dict: "_from_dict",
+    str: "_from_str",
+    list: "_from_list",
+    Series: "_from_pd_series",
+    DataFrame: "_from_pd_dataframe",
+}
+
+
 class Element(BaseModel, ABC):
     """Base class for elements within the LionAGI system.
 
@@ -55,7 +70,7 @@ class Element(BaseModel, ABC):
     )
 
     timestamp: str = Field(
-        default_factory=lambda: SysUtil.get_timestamp(sep=None)[:-6],
+        default_factory=_creation_timestamp,
         title="Creation Timestamp",
         description="The UTC timestamp of creation",
         frozen=True,
@@ -128,15 +143,13 @@ class Component(Element, ABC):
                 return [float(element) for element in string_elements]
         raise ValueError("Invalid embedding format.")
 
-    class Config:
-        """Model configuration settings."""
-
-        extra = "allow"
-        arbitrary_types_allowed = True
-        populate_by_name = True
-        use_enum_values = True
+    model_config = ConfigDict(
+        extra="allow",
+        arbitrary_types_allowed=True,
+        populate_by_name=True,
+        use_enum_values=True,
+    )
 
-    @singledispatchmethod
     @classmethod
     def from_obj(cls, obj: Any, /, **kwargs) -> T:
         """
@@ -176,6 +189,10 @@ class Component(Element, ABC):
         Raises:
             LionTypeError: If the input type is not supported.
         """
+        # exact-type lookup first, this runs once per row/item on bulk loads
+        if (handler := _FROM_OBJ_HANDLERS.get(type(obj))) is not None:
+            return getattr(cls, handler)(obj, **kwargs)
+
         if isinstance(obj, (dict, str, list, Series, DataFrame, BaseModel)):
             return cls._dispatch_from_obj(obj, **kwargs)
 
@@ -306,7 +323,7 @@ class Component(Element, ABC):
         if "ln_id" not in dict_:
             dict_["ln_id"] = meta_.pop("ln_id", SysUtil.create_id())
         if "timestamp" not in dict_:
-            dict_["timestamp"] = SysUtil.get_timestamp(sep=None)[:-6]
+            dict_["timestamp"] = _creation_timestamp()
         if "metadata" not in dict_:
             dict_["metadata"] = {}
         if "extra_fields" not in dict_:
@@ -349,9 +366,12 @@ class Component(Element, ABC):
         """Create a list of node instances from a Pandas DataFrame."""
         pd_kwargs = pd_kwargs or {}
 
+        # convert the whole frame at once instead of a Series per row
+        records = obj.to_dict(orient="records")
+
         _objs = []
-        for index, row in obj.iterrows():
-            _obj = cls.from_obj(row, *args, **pd_kwargs, **kwargs)
+        for index, record in zip(obj.index, records):
+            _obj = cls._from_dict(record, *args, **pd_kwargs, **kwargs)
             if include_index:
                 _obj.metadata["df_index"] = index
             _objs.append(_obj)
@@ -398,7 +418,16 @@ class Component(Element, ABC):
 
     def to_dict(self, *args, dropna=False, **kwargs) -> dict[str, Any]:
         """Convert the component to a dictionary."""
-        dict_ = self.model_dump(*args, by_alias=True, **kwargs)
+        # extra_fields is dropped from the output, so skip serializing it
+        exclude = kwargs.pop("exclude", None)
+        if exclude is None:
+            exclude = {"extra_fields"}
+        elif isinstance(exclude, dict):
+            exclude = {**exclude, "extra_fields": True}
+        else:
+            exclude = {*exclude, "extra_fields"}
+
+        dict_ = self.model_dump(*args, by_alias=True, exclude=exclude, **kwargs)
 
         for field_name in list(self.extra_fields.keys()):
             if field_name not in dict_:
@@ -412,21 +441,29 @@ class Component(Element, ABC):
 
     def to_xml(self, *args, dropna=False, **kwargs) -> str:
         """Convert the component to an XML string."""
-        import xml.etree.ElementTree as ET
-
-        root = ET.Element(self.__class__.__name__)
+        from xml.sax.saxutils import escape
 
-        def convert(dict_obj: dict, parent: ET.Element) -> None:
+        # write the markup directly rather than building an ElementTree
+        def convert(dict_obj: dict, parts: list) -> None:
             for key, val in dict_obj.items():
                 if isinstance(val, dict):
-                    element = ET.SubElement(parent, key)
-                    convert(val, element)
+                    if not val:
+                        parts.append(f"<{key} />")
+                        continue
+                    parts.append(f"<{key}>")
+                    convert(val, parts)
+                    parts.append(f"</{key}>")
+                elif (text := str(val)) == "":
+                    # ElementTree self-closes elements with empty text
+                    parts.append(f"<{key} />")
                 else:
-                    element = ET.SubElement(parent, key)
-                    element.text = str(val)
+                    parts.append(f"<{key}>{escape(text)}</{key}>")
 
-        convert(self.to_dict(*args, dropna=dropna, **kwargs), root)
-        return ET.tostring(root, encoding="unicode")
+        root = self.__class__.__name__
+        parts = [f"<{root}>"]
+        convert(self.to_dict(*args, dropna=dropna, **kwargs), parts)
+        parts.append(f"</{root}>")
+        return "".join(parts)
 
     def to_pd_series(self, *args, pd_kwargs=None, dropna=False, **kwargs) -> Series:
         """Convert the node to a Pandas Series."""
@@ -461,25 +498,38 @@ class Component(Element, ABC):
             )
 
     def _meta_pop(self, indices, default=...):
-        indices = (
-            indices
-            if not isinstance(indices, list)
-            else "[^_^]".join([str(i) for i in indices])
-        )
-        dict_ = self.metadata.copy()
-        dict_ = flatten(dict_)
+        """
+        Pop a leaf value from metadata, pruning containers it leaves empty.
 
+        Indices are a list path or a flattened "[^_^]"-joined key. Only leaf
+        values can be popped; a path ending at a dict or list counts as
+        missing, same as a key absent from the flattened metadata.
+        """
+        if not isinstance(indices, list):
+            indices = indices.split("[^_^]") if isinstance(indices, str) else [indices]
+
+        path = []
+        current = self.metadata
         try:
-            out_ = dict_.pop(indices, default) if default != ... else dict_.pop(indices)
-        except KeyError as e:
+            for idx in indices:
+                if isinstance(current, list):
+                    idx = int(idx)
+                elif not isinstance(current, dict):
+                    raise KeyError(idx)
+                path.append((current, idx))
+                current = current[idx]
+            if isinstance(current, (dict, list)):
+                raise KeyError(indices[-1])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
             if default == ...:
                 raise KeyError(f"Key {indices} not found in metadata.") from e
             return default
 
-        a = unflatten(dict_)
-        self.metadata.clear()
-        self.metadata.update(a)
-        return out_
+        for container, idx in reversed(path):
+            container.pop(idx)
+            if container:
+                break
+        return current
 
     def _meta_insert(self, indices, value):
         ninsert(self.metadata, indices, value)
@@ -524,7 +574,9 @@ class Component(Element, ABC):
 
     @property
     def _all_fields(self):
-        return {**self.model_fields, **self.extra_fields}
+        # model_fields is class-level; reading it off the instance is deprecated
+        # in pydantic v2 and goes through a much slower warning path
+        return {**type(self).model_fields, **self.extra_fields}
 
     @property
     def _field_annotations(self) -> dict:
@@ -555,39 +607,27 @@ class Component(Element, ABC):
 
     @_get_field_annotation.register(str)
     def _(self, field_name: str) -> dict[str, Any]:
-        dict_ = {field_name: self._all_fields[field_name].annotation}
-        for k, v in dict_.items():
-            if "|" in str(v):
-                v = str(v)
-                v = v.split("|")
-                dict_[k] = lcall(v, strip_lower)
-            else:
-                dict_[k] = [v.__name__] if v else None
-        return dict_
+        return {field_name: _annotation_names(self._all_fields[field_name].annotation)}
 
     @_get_field_annotation.register(list)
     @_get_field_annotation.register(tuple)
     def _(self, field_names: list | tuple) -> dict[str, Any]:
-        dict_ = {}
-        for field_name in field_names:
-            dict_.update(self._get_field_annotation(field_name))
-        return dict_
+        all_fields = self._all_fields
+        return {
+            field_name: _annotation_names(all_fields[field_name].annotation)
+            for field_name in field_names
+        }
 
     def _field_has_attr(self, k: str, attr: str) -> bool:
         """Check if a field has a specific attribute."""
         if not (field := self._all_fields.get(k, None)):
             raise KeyError(f"Field {k} not found in model fields.")
 
-        if attr not in str(field):
-            try:
-                a = (
-                    attr in self._all_fields[k].json_schema_extra
-                    and self._all_fields[k].json_schema_extra[attr] is not None
-                )
-                return a if isinstance(a, bool) else False
-            except Exception:
-                return False
-        return True
+        if getattr(field, attr, None) not in (None, PydanticUndefined):
+            return True
+
+        extra = getattr(field, "json_schema_extra", None)
+        return isinstance(extra, dict) and extra.get(attr, None) is not None
 
     def __str__(self):
         dict_ = self.to_dict()
@@ -604,6 +644,25 @@ class Component(Element, ABC):
 LionIDable: TypeAlias = Union[str, Element]
 
 
+@lru_cache(maxsize=1024)
+def _parse_annotation(str_: str, annotation: Any) -> tuple[str, ...] | None:
+    # keyed on the printed form too: equal unions such as Optional[int] and
+    # int | None hash alike but parse to different names
+    if "|" in str_:
+        return tuple(strip_lower(i) for i in str_.split("|"))
+    return (annotation.__name__,) if annotation else None
+
+
+def _annotation_names(annotation: Any) -> list[str] | None:
+    """Return the lowercased type names of a field annotation."""
+    str_ = str(annotation)
+    try:
+        names = _parse_annotation(str_, annotation)
+    except TypeError:  # unhashable annotation
+        names = _parse_annotation.__wrapped__(str_, annotation)
+    return list(names) if names is not None else None
+
+
 def get_lion_id(item: LionIDable) -> str:
     """Get the Lion ID of an item."""
     if isinstance(item, Sequence) and len(item) == 1:
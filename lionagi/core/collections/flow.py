@@ -329,8 +329,10 @@ class Flow(Element):
             sequence (str, optional): The sequence to remove the item from. Defaults to "all".
         """
         if sequence == "all":
+            # only touch the sequences that actually hold the item
             for seq in self.sequences:
-                seq.remove(item)
+                if item in seq:
+                    seq.remove(item)
             return
 
         sequence = self._find_sequence(sequence)
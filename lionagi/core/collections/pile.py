@@ -198,6 +198,12 @@ class Pile(Element, Record, Generic[T]):
         Returns:
             `True` if all items are found, `False` otherwise.
         """
+        # single id or single component: one dict lookup, no list building
+        if isinstance(item, str):
+            return item in self.pile
+        if isinstance(item, Component) and not isinstance(item, (Record, Ordering)):
+            return item.ln_id in self.pile
+
         item = to_list_type(item)
         for i in item:
             try:
@@ -231,7 +237,6 @@ class Pile(Element, Record, Generic[T]):
             ItemNotFoundError: If key not found and no default specified.
         """
         key = to_list_type(key)
-        items = []
 
         for i in key:
             if i not in self:
@@ -239,10 +244,19 @@ class Pile(Element, Record, Generic[T]):
                     raise ItemNotFoundError(i)
                 return default
 
-        for i in key:
-            _id = get_lion_id(i)
-            items.append(self.pile.pop(_id))
-            self.order.remove(_id)
+        _ids = [get_lion_id(i) for i in key]
+        items = [self.pile.pop(i) for i in _ids]
+
+        if len(_ids) == 1:
+            # popping the most recent item is the common queue-like case
+            if self.order[-1] == _ids[0]:
+                self.order.pop()
+            else:
+                self.order.remove(_ids[0])
+        else:
+            # rebuild the order in a single pass instead of one scan per key
+            _removed = set(_ids)
+            self.order[:] = [i for i in self.order if i not in _removed]
 
         return pile(items) if len(items) > 1 else items[0]
 
@@ -547,6 +561,18 @@ class Pile(Element, Record, Generic[T]):
         if isinstance(value, Component):
             return {value.ln_id: value}
 
+        item_type = getattr(self, "item_type", None)
+
+        # mapping already keyed by ln_id, e.g. {edge.ln_id: edge, ...}
+        if isinstance(value, dict) and all(
+            getattr(v, "ln_id", None) == k for k, v in value.items()
+        ):
+            if item_type is not None and not all(
+                type(i) in item_type for i in value.values()
+            ):
+                raise LionTypeError(f"Invalid item type in pile. Expected {item_type}")
+            return dict(value)
+
         if self.use_obj:
             if not isinstance(value, list):
                 value = [value]
@@ -554,28 +580,21 @@ class Pile(Element, Record, Generic[T]):
                 return {getattr(i, "ln_id"): i for i in value}
 
         value = to_list_type(value)
-        if getattr(self, "item_type", None) is not None:
-            for i in value:
-                if not type(i) in self.item_type:
-                    raise LionTypeError(
-                        f"Invalid item type in pile. Expected {self.item_type}"
-                    )
-
-        if isinstance(value, list):
-            if len(value) == 1:
-                if isinstance(value[0], dict) and value[0] != {}:
-                    k = list(value[0].keys())[0]
-                    v = value[0][k]
-                    return {k: v}
-
-                # [item]
-                k = getattr(value[0], "ln_id", None)
-                if k:
-                    return {k: value[0]}
-
-            return {i.ln_id: i for i in value}
-
-        raise LionValueError("Invalid pile value")
+        if item_type is not None and not all(type(i) in item_type for i in value):
+            raise LionTypeError(f"Invalid item type in pile. Expected {item_type}")
+
+        if len(value) == 1:
+            if isinstance(value[0], dict) and value[0] != {}:
+                k = list(value[0].keys())[0]
+                v = value[0][k]
+                return {k: v}
+
+            # [item]
+            k = getattr(value[0], "ln_id", None)
+            if k:
+                return {k: value[0]}
+
+        return {i.ln_id: i for i in value}
 
     def to_df(self):
         """Return the pile as a DataFrame."""
@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import contextlib
+import sys
 from lionagi.libs import SysUtil
 from pydantic import Field, field_validator
 from .abc import Ordering, get_lion_id, ItemNotFoundError, LionIDable, Element
@@ -36,8 +37,8 @@ class Progression(Element, Ordering):
 
     @field_validator("order", mode="before")
     def _validate_order(cls, value) -> list[str]:
-        """Validate and convert the order field."""
-        return _validate_order(value)
+        """Validate and convert the order field, interning the ids."""
+        return [sys.intern(i) for i in _validate_order(value)]
 
     def __contains__(self, item):
         """Check if an item or items are in the progression."""
@@ -72,8 +73,7 @@ class Progression(Element, Ordering):
 
     def append(self, item):
         """Append an item to the end of the progression."""
-        id_ = get_lion_id(item)
-        self.order.append(id_)
+        self.order.append(sys.intern(get_lion_id(item)))
 
     def extend(self, item):
         """Extend the progression from the right with item(s)"""
@@ -1,3 +1,7 @@
+import inspect
+import linecache
+import sys
+from functools import lru_cache
 from pydantic import Field, field_validator
 from typing import Any
 from lionagi.core.collections.abc import Component, get_lion_id, LionIDable, Condition
@@ -45,7 +49,7 @@ class Edge(Component):
     @field_validator("head", "tail", mode="before")
     def _validate_head_tail(cls, value):
         """Validate the head and tail fields."""
-        return get_lion_id(value)
+        return sys.intern(get_lion_id(value))
 
     def string_condition(self):
         """
@@ -70,43 +74,41 @@ class Edge(Component):
         if self.condition is None:
             return
 
-        import inspect, sys
+        return _class_source(self.condition.__class__)
 
-        def new_getfile(object, _old_getfile=inspect.getfile):
-            if not inspect.isclass(object):
-                return _old_getfile(object)
+    def __len__(self):
+        """Return the length of the edge (always 1)."""
+        return 1
 
-            # Lookup by parent module (as in current inspect)
-            if hasattr(object, "__module__"):
-                object_ = sys.modules.get(object.__module__)
-                if hasattr(object_, "__file__"):
-                    return object_.__file__
+    def __contains__(self, item: LionIDable) -> bool:
+        """Check if the given item is the head or tail of the edge."""
+        if not isinstance(item, str):
+            item = get_lion_id(item)
+        return item == self.head or item == self.tail
 
-            # If parent module is __main__, lookup by methods (NEW)
-            for name, member in inspect.getmembers(object):
-                if (
-                    inspect.isfunction(member)
-                    and object.__qualname__ + "." + member.__name__
-                    == member.__qualname__
-                ):
-                    return inspect.getfile(member)
-            else:
-                raise TypeError("Source for {!r} not found".format(object))
 
-        inspect.getfile = new_getfile
+def _class_file(cls) -> str:
+    """Locate the file defining `cls`, including classes defined in __main__."""
+    # Lookup by parent module (as in current inspect)
+    module = sys.modules.get(getattr(cls, "__module__", None))
+    if hasattr(module, "__file__"):
+        return module.__file__
 
-        import inspect
-        from IPython.core.magics.code import extract_symbols
+    # If parent module is __main__, lookup by methods
+    for _, member in inspect.getmembers(cls):
+        if (
+            inspect.isfunction(member)
+            and cls.__qualname__ + "." + member.__name__ == member.__qualname__
+        ):
+            return inspect.getfile(member)
 
-        obj = self.condition.__class__
-        cell_code = "".join(inspect.linecache.getlines(new_getfile(obj)))
-        class_code = extract_symbols(cell_code, obj.__name__)[0][0]
-        return class_code
+    raise TypeError("Source for {!r} not found".format(cls))
 
-    def __len__(self):
-        """Return the length of the edge (always 1)."""
-        return 1
 
-    def __contains__(self, item: LionIDable) -> bool:
-        """Check if the given item is the head or tail of the edge."""
-        return get_lion_id(item) in (self.head, self.tail)
+@lru_cache(maxsize=1024)
+def _class_source(cls) -> str:
+    """Extract and cache the source code of a condition class."""
+    from IPython.core.magics.code import extract_symbols
+
+    cell_code = "".join(linecache.getlines(_class_file(cls)))
+    return extract_symbols(cell_code, cls.__name__)[0][0]
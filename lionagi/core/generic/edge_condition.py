@@ -1,5 +1,5 @@
 from typing import Any
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from lionagi.core.collections.abc import Condition
 from pydantic import BaseModel
 
@@ -10,7 +10,4 @@ class EdgeCondition(Condition, BaseModel):
         description="The source for condition check",
     )
 
-    class Config:
-        """Model configuration settings."""
-
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
@@ -15,7 +15,7 @@ limitations under the License.
 """
 
 from typing import Any
-from .message import RoledMessage, MessageRole
+from .message import RoledMessage, MessageRole, _JSON_SCALARS
 
 
 class AssistantResponse(RoledMessage):
@@ -69,10 +69,12 @@ class AssistantResponse(RoledMessage):
         Returns:
             AssistantResponse: A new instance of the object with the same content and additional keyword arguments.
         """
-        import json
+        content = self.content["assistant_response"]
+        if not isinstance(content, _JSON_SCALARS):
+            import json
 
-        content = json.dumps(self.content["assistant_response"])
-        content = {"content": json.loads(content)}
+            content = json.loads(json.dumps(content))
+        content = {"content": content}
         response_copy = AssistantResponse(assistant_response=content, **kwargs)
         response_copy.metadata["origin_ln_id"] = self.ln_id
         return response_copy
@@ -89,22 +89,17 @@ class Instruction(RoledMessage):
         if "images" not in self.content:
             return text_msg
 
-        text_msg["content"].pop("images", None)
-        text_msg["content"].pop("image_detail", None)
-        text_msg["content"] = [
-            {"type": "text", "text": text_msg["content"]},
+        text_content = text_msg["content"]
+        text_content.pop("images", None)
+        text_content.pop("image_detail", None)
+        detail = self.content["image_detail"]
+        text_msg["content"] = [{"type": "text", "text": text_content}] + [
+            {
+                "type": "image_url",
+                "image_url": {"url": f"data:image/jpeg;base64,{i}", "detail": detail},
+            }
+            for i in self.content["images"]
         ]
-
-        for i in self.content["images"]:
-            text_msg["content"].append(
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{i}",
-                        "detail": self.content["image_detail"],
-                    },
-                }
-            )
         return text_msg
 
     def _add_context(self, context: dict | str | None = None, **kwargs):
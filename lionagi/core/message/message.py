@@ -43,6 +43,48 @@ class MessageRole(str, Enum):
     ASSISTANT = "assistant"
 
 
+_ROLE_VALUES = frozenset(i.value for i in MessageRole)
+
+# immutable JSON values, safe to share between a message and its clone
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+_PREVIEW_LEN = 75
+
+
+def _repr_chunks(obj):
+    """Yield str(obj) piece by piece so a preview can stop early."""
+    # exact types only: subclasses such as OrderedDict have their own repr
+    if type(obj) is dict or type(obj) is list:
+        is_dict = type(obj) is dict
+        yield "{" if is_dict else "["
+        for idx, item in enumerate(obj.items() if is_dict else obj):
+            if idx:
+                yield ", "
+            if is_dict:
+                yield from _repr_chunks(item[0])
+                yield ": "
+                item = item[1]
+            yield from _repr_chunks(item)
+        yield "}" if is_dict else "]"
+    elif type(obj) is str and len(obj) > _PREVIEW_LEN:
+        # already past the budget, so the closing quote is never shown
+        yield repr(obj[: _PREVIEW_LEN + 1])[:-1]
+    else:
+        yield repr(obj)
+
+
+def _content_preview(content) -> str:
+    if isinstance(content, str):
+        text = content[: _PREVIEW_LEN + 1]
+    else:
+        text = ""
+        for chunk in _repr_chunks(content):
+            text += chunk
+            if len(text) > _PREVIEW_LEN:
+                break
+    return f"{text[:_PREVIEW_LEN]}..." if len(text) > _PREVIEW_LEN else text
+
+
 # Base class for messages
 class RoledMessage(Node, Sendable):
     """
@@ -76,16 +118,19 @@ class RoledMessage(Node, Sendable):
             raise ValueError("Message role not set")
 
         role = self.role.value if isinstance(self.role, Enum) else self.role
-        if role not in [i.value for i in MessageRole]:
+        if role not in _ROLE_VALUES:
             raise ValueError(f"Invalid message role: {role}")
 
-        content_dict = self.content.copy()
+        content_dict = self.content
 
         if not content_dict.get("images", None):
             if len(content_dict) == 1:
-                content_dict = str(list(content_dict.values())[0])
+                content_dict = str(next(iter(content_dict.values())))
             else:
                 content_dict = str(content_dict)
+        else:
+            # only the image payload is reshaped in place by subclasses
+            content_dict = content_dict.copy()
 
         return {"role": role, "content": content_dict}
 
@@ -93,9 +138,5 @@ class RoledMessage(Node, Sendable):
         """
         Provides a string representation of the message with content preview.
         """
-        content_preview = (
-            f"{str(self.content)[:75]}..."
-            if len(str(self.content)) > 75
-            else str(self.content)
-        )
+        content_preview = _content_preview(self.content)
         return f"Message(role={self.role}, sender={self.sender}, content='{content_preview}')"
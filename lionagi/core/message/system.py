@@ -16,7 +16,7 @@ limitations under the License.
 
 from typing import Any
 from ..collections.abc import Field
-from .message import RoledMessage, MessageRole
+from .message import RoledMessage, MessageRole, _JSON_SCALARS
 
 
 class System(RoledMessage):
@@ -78,9 +78,11 @@ class System(RoledMessage):
         Returns:
             System: A new instance of the object with the same content and additional keyword arguments.
         """
-        import json
+        system = self.system_info
+        if not isinstance(system, _JSON_SCALARS):
+            import json
 
-        system = json.dumps(self.system_info)
-        system_copy = System(system=json.loads(system), **kwargs)
+            system = json.loads(json.dumps(system))
+        system_copy = System(system=system, **kwargs)
         system_copy.metadata["origin_ln_id"] = self.ln_id
         return system_copy
@@ -19,7 +19,7 @@ import json
 import contextlib
 
 from lionagi.libs import ParseUtil
-from lionagi.libs.ln_convert import strip_lower, to_dict
+from lionagi.libs.ln_convert import to_dict
 from lionagi.libs.ln_nested import nget
 
 from .message import RoledMessage
@@ -170,7 +170,11 @@ def _parse_action_request(response):
     message = to_dict(response) if not isinstance(response, dict) else response
     content_ = None
 
-    if strip_lower(nget(message, ["content"])) == "none":
+    content = message["content"]
+
+    if content is None or (
+        isinstance(content, str) and content.strip().lower() == "none"
+    ):
         content_ = _handle_action_request(message)
 
     elif nget(message, ["content", "tool_uses"], None):
@@ -261,23 +265,18 @@ def _handle_action_request(response):
         ValueError: If the response message is invalid.
     """
     try:
-        tool_count = 0
         func_list = []
-        while tool_count < len(response["tool_calls"]):
-            _path = ["tool_calls", tool_count, "type"]
-
-            if nget(response, _path) == "function":
-                _path1 = ["tool_calls", tool_count, "function", "name"]
-                _path2 = ["tool_calls", tool_count, "function", "arguments"]
-
-                func_content = {
-                    "action": f"action_{nget(response, _path1)}",
-                    "arguments": nget(response, _path2),
-                }
-                func_list.append(func_content)
-            tool_count += 1
+        for tool_call in response["tool_calls"]:
+            if tool_call.get("type") == "function":
+                function = tool_call["function"]
+                func_list.append(
+                    {
+                        "action": f"action_{function['name']}",
+                        "arguments": function["arguments"],
+                    }
+                )
         return func_list
-    except:
+    except Exception:
         raise ValueError(
             "Response message must be one of regular response or function calling"
         )
@@ -115,11 +115,10 @@ class Form(BaseForm):
         Returns:
             Dict[str, Any]: The relevant fields for the current task.
         """
-        dict_ = self.to_dict()
         return {
-            k: v
-            for k, v in dict_.items()
-            if k not in SYSTEM_FIELDS and k in self.input_fields + self.requested_fields
+            k: getattr(self, k, None)
+            for k in self.input_fields + self.requested_fields
+            if k not in SYSTEM_FIELDS
         }
 
     def fill(self, form: "Form" = None, strict: bool = True, **kwargs) -> None:
@@ -137,13 +136,10 @@ class Form(BaseForm):
                 raise ValueError("Form is filled, cannot be worked on again")
 
         all_fields = self._get_all_fields(form, **kwargs)
+        work_fields = self.work_fields.keys()
 
         for k, v in all_fields.items():
-            if (
-                k in self.work_fields
-                and v is not None
-                and getattr(self, k, None) is None
-            ):
+            if k in work_fields and v is not None and getattr(self, k, None) is None:
                 setattr(self, k, v)
 
     def is_workable(self) -> bool:
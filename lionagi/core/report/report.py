@@ -80,10 +80,11 @@ class Report(BaseForm):
                     self._add_field(_field, value=None, field_obj=field_obj)
 
         # Synchronize fields between report and forms
+        form_fields = [(_form, set(_form.work_fields)) for _form in self.forms]
         for k, v in self._all_fields.items():
             if getattr(self, k, None) is not None:
-                for _form in self.forms:
-                    if k in _form.work_fields:
+                for _form, _fields in form_fields:
+                    if k in _fields:
                         _form.fill(**{k: getattr(self, k)})
 
     @property
@@ -106,8 +107,9 @@ class Report(BaseForm):
 
         # if there are information in the forms that are not in the report,
         # add them to the report
+        work_fields = self.work_fields.keys()
         for k, v in all_fields.items():
-            if k in self.work_fields and getattr(self, k, None) is None:
+            if k in work_fields and getattr(self, k, None) is None:
                 setattr(self, k, v)
 
         # if there are information in the report that are not in the forms,
@@ -139,8 +141,9 @@ class Report(BaseForm):
         fields.extend(self.requested_fields)
 
         # if the report's own assignment is not in the forms, return False
+        work_fields = set(self.work_fields)
         for f in fields:
-            if f not in self.work_fields:
+            if f not in work_fields:
                 raise ValueError(f"Field {f} is not in the forms")
 
         # get all the output fields from all the forms
@@ -213,7 +213,9 @@ class Branch(Node, DirectiveMixin):
         Returns:
             list[dict[str, Any]]: A list of chat messages.
         """
-        return [self.messages[j].chat_msg for j in self.progress]
+        # progress holds message ids, so index the pile's id map directly
+        messages = self.messages.pile
+        return [messages[j].chat_msg for j in self.progress]
 
     def _remove_system(self) -> None:
         """
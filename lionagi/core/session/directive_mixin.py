@@ -16,6 +16,8 @@ limitations under the License.
 
 # lionagi/core/session/directive_mixin.py
 
+import asyncio
+
 from lionagi.core.unit import Unit
 from ..message.action_response import ActionResponse
 
@@ -100,6 +102,9 @@ class DirectiveMixin:
                 duration), default is False.
             return_branch (bool, optional): Whether to return the branch after
                 processing, default is False.
+            images (str | list[str], optional): Base64 encoded image(s).
+            image_path (str | list[str], optional): Image file path(s), read
+                when no images are given.
             **kwargs: Additional keyword arguments for further customization.
 
         Returns:
@@ -119,9 +124,7 @@ class DirectiveMixin:
             self.add_message(system=system)
 
         if not images and image_path:
-            from lionagi.libs import ImageUtil
-
-            images = ImageUtil.read_image_to_base64(image_path)
+            images = await _read_images(image_path)
 
         return await directive.chat(
             instruction=instruction,
@@ -203,6 +206,9 @@ class DirectiveMixin:
             system (str, optional): Optionally swap the system message.
             rulebook (Any, optional): The rulebook to use for validation.
             directive (str, optional): Directive for the operation.
+            images (str | list[str], optional): Base64 encoded image(s).
+            image_path (str | list[str], optional): Image file path(s), read
+                when no images are given.
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -216,9 +222,7 @@ class DirectiveMixin:
             self.add_message(system=system)
 
         if not images and image_path:
-            from lionagi.libs import ImageUtil
-
-            images = ImageUtil.read_image_to_base64(image_path)
+            images = await _read_images(image_path)
 
         _directive = Unit(self, imodel=imodel, rulebook=rulebook, verbose=verbose)
 
@@ -285,3 +289,16 @@ class DirectiveMixin:
             form.action_response.update(_dict)
         
         return form
+
+
+async def _read_images(image_path: str | list[str]) -> list[str]:
+    """Read image file(s) to base64 in worker threads, off the event loop."""
+    from lionagi.libs import ImageUtil
+
+    paths = image_path if isinstance(image_path, list) else [image_path]
+    # an unreadable path raises, naming the path, rather than returning None
+    return list(
+        await asyncio.gather(
+            *(asyncio.to_thread(ImageUtil.read_image_to_base64, p) for p in paths)
+        )
+    )
@@ -168,16 +168,14 @@ class DirectiveMixin(ABC):
                         sender=sender,
                     )
 
-                a = branch.messages[-1]._meta_get(
-                    ["extra", "usage", "prompt_tokens"], 0
-                )
-                b = branch.messages[-1]._meta_get(
-                    ["extra", "usage", "completion_tokens"], 0
-                )
-                m = completion.get("model", None)
-                if m:
+                if completion.get("model", None):
+                    last_msg = branch.messages[-1]
+                    usage = last_msg._meta_get(["extra", "usage"], None) or {}
+                    a = usage.get("prompt_tokens", 0)
+                    b = usage.get("completion_tokens", 0)
+                    price = price or (0, 0)
                     ttl = (a * price[0] + b * price[1]) / 1000000
-                    branch.messages[-1]._meta_insert(["extra", "usage", "expense"], ttl)
+                    last_msg._meta_insert(["extra", "usage", "expense"], ttl)
                 return msg
 
             if _choices and not isinstance(_choices, list):
@@ -386,11 +384,11 @@ class DirectiveMixin(ABC):
             **kwargs,
         )
 
+        imodel = imodel or self.imodel
         payload, completion = await self._call_chatcompletion(
             imodel=imodel, branch=branch, **config
         )
 
-        imodel = imodel or self.imodel
         out_ = await self._output(
             payload=payload,
             completion=completion,
@@ -21,19 +21,25 @@ choices_fields = ["index", "message", "logprobs", "finish_reason"]
 
 usage_fields = ["prompt_tokens", "completion_tokens", "total_tokens"]
 
-from typing import Callable
 from lionagi.core.action.tool import Tool
 from lionagi.core.action.tool_manager import func_to_tool
 
 
 def process_tools(tool_obj, branch):
-    if isinstance(tool_obj, Callable):
+    if isinstance(tool_obj, bool):
+        return
+    if not isinstance(tool_obj, (list, tuple)):
         _process_tool(tool_obj, branch)
-    else:
-        if isinstance(tool_obj, bool):
-            return
-        for i in tool_obj:
-            _process_tool(i, branch)
+        return
+
+    # walk nested lists iteratively, keeping the given order
+    stack = list(reversed(tool_obj))
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (list, tuple)):
+            stack.extend(reversed(item))
+        elif not isinstance(item, bool):
+            _process_tool(item, branch)
 
 
 def _process_tool(tool_obj, branch):
@@ -42,10 +48,12 @@ def _process_tool(tool_obj, branch):
         and tool_obj.schema_["function"]["name"] not in branch.tool_manager.registry
     ):
         branch.register_tools(tool_obj)
-    if isinstance(tool_obj, Callable):
-        tool = func_to_tool(tool_obj)[0]
-        if tool.schema_["function"]["name"] not in branch.tool_manager.registry:
-            branch.register_tools(tool)
+    elif callable(tool_obj):
+        # the schema name is the function name; only build a Tool when needed
+        if getattr(tool_obj, "__name__", None) not in branch.tool_manager.registry:
+            tool = func_to_tool(tool_obj)[0]
+            if tool.schema_["function"]["name"] not in branch.tool_manager.registry:
+                branch.register_tools(tool)
 
 
 async def _direct(
@@ -212,45 +212,25 @@ class Validator:
                 )
 
         dict_ = {}
+        requested_fields = set(form.requested_fields)
         for k, v in response.items():
-            if k in form.requested_fields:
+            if k in requested_fields:
                 kwargs = form.validation_kwargs.get(k, {})
-                _annotation = form._field_annotations[k]
-                if (keys := form._get_field_attr(k, "choices", None)) is not None:
-                    v = await self.validate_field(
-                        field=k,
-                        value=v,
-                        form=form,
-                        annotation=_annotation,
-                        strict=strict,
-                        keys=keys,
-                        use_annotation=use_annotation,
-                        **kwargs,
-                    )
-
-                elif (_keys := form._get_field_attr(k, "keys", None)) is not None:
-
-                    v = await self.validate_field(
-                        field=k,
-                        value=v,
-                        form=form,
-                        annotation=_annotation,
-                        strict=strict,
-                        keys=_keys,
-                        use_annotation=use_annotation,
-                        **kwargs,
-                    )
-
-                else:
-                    v = await self.validate_field(
-                        field=k,
-                        value=v,
-                        form=form,
-                        annotation=_annotation,
-                        strict=strict,
-                        use_annotation=use_annotation,
-                        **kwargs,
-                    )
+                _annotation = form._get_field_annotation(k)[k]
+                if (keys := form._get_field_attr(k, "choices", None)) is None:
+                    keys = form._get_field_attr(k, "keys", None)
+                if keys is not None:
+                    kwargs = {"keys": keys, **kwargs}
+
+                v = await self.validate_field(
+                    field=k,
+                    value=v,
+                    form=form,
+                    annotation=_annotation,
+                    strict=strict,
+                    use_annotation=use_annotation,
+                    **kwargs,
+                )
             dict_[k] = v
         form.fill(**dict_)
         return form
@@ -83,7 +83,7 @@ class WorkFunction:
         Returns:
             bool: True if the work function is progressable, otherwise False.
         """
-        return self.worklog.pending_work and not self.worklog.stopped
+        return not self.worklog.stopped and self.worklog.has_pending_work
 
     async def perform(self, *args, **kwargs):
         """
@@ -15,7 +15,7 @@ limitations under the License.
 """
 
 from abc import ABC
-from functools import wraps
+from functools import lru_cache, wraps
 import inspect
 from lionagi import logging as _logging
 from lionagi.core.work.work_function import WorkFunction
@@ -24,6 +24,12 @@ from lionagi.core.report.form import Form
 from lionagi.core.collections.abc import get_lion_id
 
 
+@lru_cache(maxsize=None)
+def _get_signature(func) -> inspect.Signature:
+    """Signatures of decorated functions never change, so inspect each once."""
+    return inspect.signature(func)
+
+
 class Worker(ABC):
     """
     This class represents a worker that handles multiple work functions.
@@ -123,7 +129,7 @@ class Worker(ABC):
         """
         worklink_decorated_function = self._get_decorated_functions(decorator_attr="_worklink_decorator_params", name_only=False)
         for func_name, func, _ in worklink_decorated_function:
-            func_signature = inspect.signature(func)
+            func_signature = _get_signature(func)
             if "from_work" not in func_signature.parameters and "from_result" not in func_signature.parameters:
                 raise ValueError(f"Either \"from_work\" or \"from_result\" must be a parameter in function {func_name}")
 
@@ -181,7 +187,7 @@ class Worker(ABC):
 
         # locate form that should be filled according to the assignment
         if form_param_key:
-            func_signature = inspect.signature(function)
+            func_signature = _get_signature(function)
             if form_param_key not in func_signature.parameters:
                 raise KeyError(f"Failed to locate form. \"{form_param_key}\" is not defined in the function.")
             if "self" in func_signature.parameters:
@@ -316,7 +322,7 @@ def worklink(
             if from_ not in work_funcs or to_ not in work_funcs:
                 raise ValueError("Invalid link. 'from_' and 'to_' must be the name of work decorated functions.")
 
-            func_signature = inspect.signature(func)
+            func_signature = _get_signature(func)
             if "from_work" not in func_signature.parameters and "from_result" not in func_signature.parameters:
                 raise ValueError(f"Either \"from_work\" or \"from_result\" must be a parameter in function {func.__name__}")
 
@@ -106,8 +106,7 @@ class WorkerEngine:
         elif isinstance(updated_task, list):
             self.tasks.include(updated_task)
             self.active_tasks.include(updated_task)
-        else:
-            await asyncio.sleep(self.refresh_time)
+        # a task still in progress is polled again after execute's refresh sleep
 
     async def execute(self, stop_queue=True):
         """
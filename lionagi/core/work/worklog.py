@@ -80,6 +80,16 @@ class WorkLog(Progressable):
         """
         return pile([i for i in self.pile if i.status == WorkStatus.PENDING])
 
+    @property
+    def has_pending_work(self):
+        """
+        Checks if any work item is still pending, stopping at the first one.
+
+        Returns:
+            bool: True if there is pending work, else False.
+        """
+        return any(i.status == WorkStatus.PENDING for i in self.pile)
+
     @property
     def stopped(self):
         """
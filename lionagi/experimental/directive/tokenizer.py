@@ -18,6 +18,8 @@ import re
 
 
 class BaseToken:
+    __slots__ = ("type", "value")
+
     def __init__(self, type_, value):
         self.type = type_
         self.value = value
@@ -16,6 +16,57 @@ limitations under the License.
 
 import ast
 import operator
+import threading
+from collections import OrderedDict
+
+# node types accepted besides the evaluator's allowed operators
+_EXPRESSION_NODES = frozenset(
+    {ast.Expression, ast.Compare, ast.Name, ast.Load, ast.Constant}
+)
+_STATEMENT_NODES = _EXPRESSION_NODES | {
+    ast.Module,
+    ast.Assign,
+    ast.Expr,
+    ast.Call,
+    ast.Store,
+}
+
+_AST_CACHE_SIZE = 1024
+_ast_cache = threading.local()
+
+
+def _validate_tree(tree, allowed_nodes, allowed_operators):
+    """Reject the whole tree up front if it holds any unsupported node."""
+    for node in ast.walk(tree):
+        type_ = type(node)
+        if type_ not in allowed_nodes and type_ not in allowed_operators:
+            raise ValueError(f"Operation {type_.__name__} is not allowed.")
+    return tree
+
+
+def _get_validated_ast(source, mode, allowed_nodes, allowed_operators):
+    """
+    Parse and validate `source` once, reusing trees from a bounded per-thread
+    LRU cache keyed by the source and the nodes and operators it was checked
+    against. Trees that fail validation are not cached.
+    """
+    cache = getattr(_ast_cache, "trees", None)
+    if cache is None:
+        cache = _ast_cache.trees = OrderedDict()
+
+    key = (source, mode, allowed_nodes, frozenset(allowed_operators))
+    tree = cache.get(key)
+    if tree is not None:
+        cache.move_to_end(key)
+        return tree
+
+    tree = _validate_tree(
+        ast.parse(source, mode=mode), allowed_nodes, allowed_operators
+    )
+    cache[key] = tree
+    if len(cache) > _AST_CACHE_SIZE:
+        cache.popitem(last=False)
+    return tree
 
 
 class ASTEvaluator:
@@ -39,7 +90,9 @@ class ASTEvaluator:
         Evaluate a condition expression within a given context using AST parsing.
         """
         try:
-            tree = ast.parse(expression, mode="eval")
+            tree = _get_validated_ast(
+                expression, "eval", _EXPRESSION_NODES, self.allowed_operators
+            )
             return self._evaluate_node(tree.body, context)
         except Exception as e:
             raise ValueError(f"Failed to evaluate expression: {expression}. Error: {e}")
@@ -48,11 +101,8 @@ class ASTEvaluator:
         if isinstance(node, ast.Compare):
             left = self._evaluate_node(node.left, context)
             for operation, comparator in zip(node.ops, node.comparators):
-                op_func = self.allowed_operators.get(type(operation))
-                if not op_func:
-                    raise ValueError(
-                        f"Operation {type(operation).__name__} is not allowed."
-                    )
+                # operators were checked against the whitelist at parse time
+                op_func = self.allowed_operators[type(operation)]
                 right = self._evaluate_node(comparator, context)
                 if not op_func(left, right):
                     return False
@@ -60,7 +110,7 @@ class ASTEvaluator:
         elif isinstance(node, ast.Name):
             return context.get(node.id)
         elif isinstance(node, ast.Constant):
-            return node.n
+            return node.value
         else:
             raise ValueError(
                 "Unsupported AST node type encountered in condition evaluation."
@@ -110,7 +160,9 @@ class ASTEvaluationEngine:
         """
         Parses and executes a script, handling variable assignments and function calls.
         """
-        tree = ast.parse(script, mode="exec")
+        tree = _get_validated_ast(
+            script, "exec", _STATEMENT_NODES, self.safe_evaluator.allowed_operators
+        )
         for stmt in tree.body:
             if isinstance(stmt, ast.Assign):
                 var_name = stmt.targets[
@@ -1,26 +1,29 @@
+from functools import lru_cache
 from typing import Union, Dict, Any
 import subprocess
 
 from lionagi.libs.sys_util import SysUtil
 from lionagi.libs.ln_api import BaseService
 
-allowed_kwargs = [
-    # "model",
-    "tokenizer",
-    "modelcard",
-    "framework",
-    "task",
-    "num_workers",
-    "batch_size",
-    "args_parser",
-    "device",
-    "torch_dtype",
-    "min_length_for_response",
-    "minimum_tokens",
-    "mask_token",
-    "max_length",
-    "max_new_tokens",
-]
+allowed_kwargs = frozenset(
+    {
+        # "model",
+        "tokenizer",
+        "modelcard",
+        "framework",
+        "task",
+        "num_workers",
+        "batch_size",
+        "args_parser",
+        "device",
+        "torch_dtype",
+        "min_length_for_response",
+        "minimum_tokens",
+        "mask_token",
+        "max_length",
+        "max_new_tokens",
+    }
+)
 
 
 def get_pytorch_install_command():
@@ -42,6 +45,29 @@ def install_pytorch():
         print(f"Failed to install PyTorch: {e}")
 
 
+@lru_cache(maxsize=None)
+def _load_pipeline():
+    try:
+        from transformers import pipeline
+
+        return pipeline
+    except ImportError:
+        try:
+            if not SysUtil.is_package_installed("torch"):
+                install_pytorch()
+            if not SysUtil.is_package_installed("transformers"):
+                SysUtil.install_import(
+                    package_name="transformers", import_name="pipeline"
+                )
+            from transformers import pipeline
+
+            return pipeline
+        except Exception as e:
+            raise ImportError(
+                f"Unable to import required module from transformers. Please make sure that transformers is installed. Error: {e}"
+            )
+
+
 class TransformersService(BaseService):
     def __init__(
         self,
@@ -56,25 +82,7 @@ class TransformersService(BaseService):
         self.model = model
         self.config = config
         self.allowed_kwargs = allowed_kwargs
-        try:
-            from transformers import pipeline
-
-            self.pipeline = pipeline
-        except ImportError:
-            try:
-                if not SysUtil.is_package_installed("torch"):
-                    install_pytorch()
-                if not SysUtil.is_package_installed("transformers"):
-                    SysUtil.install_import(
-                        package_name="transformers", import_name="pipeline"
-                    )
-                    from transformers import pipeline
-
-                    self.pipeline = pipeline
-            except Exception as e:
-                raise ImportError(
-                    f"Unable to import required module from transformers. Please make sure that transformers is installed. Error: {e}"
-                )
+        self.pipeline = _load_pipeline()
 
         self.pipe = self.pipeline(
             task=task, model=model, config=config, device=device, **kwargs
@@ -86,12 +94,9 @@ class TransformersService(BaseService):
                 raise ValueError(f"Invalid transformers pipeline task: {self.task}.")
 
         payload = {"messages": messages}
-        config = {}
-        for k, v in kwargs.items():
-            if k == "max_tokens":
-                config["max_new_tokens"] = v
-            if k in allowed_kwargs:
-                config[k] = v
+        config = {k: v for k, v in kwargs.items() if k in allowed_kwargs}
+        if "max_tokens" in kwargs:
+            config["max_new_tokens"] = kwargs["max_tokens"]
 
         msg = "".join([i["content"] for i in messages if i["role"] == "user"])
         conversation = ""
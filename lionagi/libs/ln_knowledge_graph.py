@@ -277,13 +277,13 @@ class KGTripletExtractor:
         article_publish_date=None,
         verbose=False,
     ):
-        from lionagi.integrations.bridge.transformers_.install_ import (
-            install_transformers,
-        )
-
         try:
             from transformers import AutoModelForSeq2SeqLM, AutoTokenizer  # type: ignore
         except ImportError:
+            from lionagi.integrations.bridge.transformers_.install_ import (
+                install_transformers,
+            )
+
             install_transformers()
         from transformers import AutoModelForSeq2SeqLM, AutoTokenizer  # type: ignore
         import torch  # type: ignore
@@ -457,10 +457,10 @@ class ParseUtil:
         # Extracting function name and docstring details
         func_name = func.__name__
 
-        if not func_description:
-            func_description, _ = ParseUtil._extract_docstring_details(func, style)
-        if not params_description:
-            _, params_description = ParseUtil._extract_docstring_details(func, style)
+        if not func_description or not params_description:
+            _description, _params = ParseUtil._extract_docstring_details(func, style)
+            func_description = func_description or _description
+            params_description = params_description or _params
 
         # Extracting parameters with typing hints
         sig = inspect.signature(func)
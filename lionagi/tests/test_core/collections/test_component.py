@@ -3,10 +3,12 @@ from lionagi.core.collections.abc.component import (
     Component,
     LionValueError,
     LionTypeError,
+    _parse_annotation,
 )
 import pandas as pd
 from datetime import datetime
 import json
+from typing import Optional
 
 
 class TestComponent(unittest.TestCase):
@@ -52,6 +54,18 @@ class TestComponent(unittest.TestCase):
         xml_str = self.component.to_xml()
         self.assertIn("<content>example content</content>", xml_str)
 
+    def test_to_xml_empty_values(self):
+        """Test that empty strings and dicts self-close like ElementTree."""
+        self.component.content = ""
+        self.component._meta_insert(["nested", "note"], "")
+        self.component._meta_insert(["nested", "text"], "a < b & c")
+        self.component._meta_insert(["empty"], {})
+        xml_str = self.component.to_xml()
+        self.assertIn("<content />", xml_str)
+        self.assertIn("<note />", xml_str)
+        self.assertIn("<text>a &lt; b &amp; c</text>", xml_str)
+        self.assertIn("<empty />", xml_str)
+
     def test_to_pd_series(self):
         """Test converting to Pandas Series."""
         self.component.content = "example content"
@@ -108,6 +122,35 @@ class TestComponent(unittest.TestCase):
         self.assertEqual(self.component.metadata["nested"][0], nested_value)
         self.assertEqual(self.component._meta_get(["nested", 0, "a"]), 1)
 
+    def test_meta_pop(self):
+        """Test popping leaf values from metadata."""
+        self.component._meta_insert(["a", "b"], 1)
+        self.component._meta_insert(["a", "c"], 2)
+        self.component._meta_insert(["l"], [10, {"x": 20}])
+
+        self.assertEqual(self.component._meta_pop(["a", "b"]), 1)
+        self.assertEqual(self.component.metadata["a"], {"c": 2})
+        # emptied parents are pruned
+        self.assertEqual(self.component._meta_pop("a[^_^]c"), 2)
+        self.assertNotIn("a", self.component.metadata)
+
+        self.assertEqual(self.component._meta_pop(["l", 1, "x"]), 20)
+        self.assertEqual(self.component.metadata["l"], [10])
+        self.assertEqual(self.component._meta_pop("l[^_^]0"), 10)
+        self.assertNotIn("l", self.component.metadata)
+
+    def test_meta_pop_missing(self):
+        """Test popping missing keys and subtrees from metadata."""
+        self.component._meta_insert(["a", "b"], 1)
+        self.assertEqual(self.component._meta_pop(["x", "y"], None), None)
+        with self.assertRaises(KeyError):
+            self.component._meta_pop("x")
+        # only leaves can be popped; a subtree counts as missing
+        self.assertEqual(self.component._meta_pop(["a"], "default"), "default")
+        with self.assertRaises(KeyError):
+            self.component._meta_pop("a")
+        self.assertEqual(self.component.metadata["a"], {"b": 1})
+
     def test_invalid_metadata_assignment(self):
         """Test invalid direct assignment to metadata."""
         with self.assertRaises(AttributeError):
@@ -119,6 +162,18 @@ class TestComponent(unittest.TestCase):
         self.assertIn("ln_id", annotations)
         self.assertIn("timestamp", annotations)
 
+    def test_equal_union_annotations(self):
+        """Test equal unions written differently keep their own names."""
+        expected = {"optional": ["Optional"], "pipe": ["int", "none"]}
+        annotations = {"optional": Optional[int], "pipe": int | None}
+        for order in (["optional", "pipe"], ["pipe", "optional"]):
+            _parse_annotation.cache_clear()
+            for key in order:
+                self.component._add_field(key, annotations[key], value=1)
+                self.assertEqual(
+                    self.component._get_field_annotation(key), {key: expected[key]}
+                )
+
     def test_dynamic_field_addition(self):
         """Test adding fields dynamically to the Component."""
         self.component._add_field(
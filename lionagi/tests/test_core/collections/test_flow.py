@@ -126,6 +126,12 @@ class TestFlow(unittest.TestCase):
         self.flow.remove(node_to_remove)
         self.assertNotIn(node_to_remove.ln_id, self.flow.get("right"))
 
+    def test_remove_from_single_sequence(self):
+        node_to_remove = self.nodes[6]
+        self.flow.remove(node_to_remove)
+        self.assertNotIn(node_to_remove.ln_id, self.flow.get("right"))
+        self.assertEqual(len(self.flow.get("left")), 5)
+
     def test_shape_empty_flow(self):
         empty_flow = flow()
         self.assertEqual(empty_flow.shape(), {})
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 import asyncio
 from lionagi.core.collections.pile import Pile
@@ -134,15 +136,19 @@ class TestPile(unittest.TestCase):
 
     def test_to_csv(self):
         """Test saving the pile to a CSV file."""
-        self.p1.to_csv("test_pile.csv")
-        with open("test_pile.csv", "r") as f:
-            content = f.read()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "test_pile.csv")
+            self.p1.to_csv(path)
+            with open(path, "r") as f:
+                content = f.read()
         self.assertIn("content", content)
 
     def test_from_csv(self):
         """Test loading a pile from a CSV file."""
-        self.p1.to_csv("test_pile.csv")
-        loaded_pile = Pile.from_csv("test_pile.csv")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "test_pile.csv")
+            self.p1.to_csv(path)
+            loaded_pile = Pile.from_csv(path)
         self.assertEqual(len(loaded_pile), 3)
         self.assertEqual(loaded_pile[0].content, "A")
 
@@ -1,3 +1,4 @@
+import sys
 import unittest
 from lionagi.core.collections.abc import ItemNotFoundError
 from lionagi.core.collections import Progression
@@ -124,6 +125,21 @@ class TestProgression(unittest.TestCase):
         new_prog = self.p + new_node
         self.assertNotEqual(self.p.order, new_prog)
 
+    def test_ids_interned(self):
+        """Test that every way of storing an id interns it."""
+
+        def fresh_ids(n):
+            # equal strings that are distinct objects from the interned ones
+            return ["".join(list(Node().ln_id)) for _ in range(n)]
+
+        p = Progression(order=fresh_ids(2))
+        p.extend(fresh_ids(2))
+        p.include(fresh_ids(1))
+        p.append(fresh_ids(1)[0])
+        self.assertEqual(len(p), 6)
+        for id_ in p.order:
+            self.assertIs(id_, sys.intern(id_))
+
 
 if __name__ == "__main__":
     unittest.main()
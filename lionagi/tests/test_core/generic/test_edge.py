@@ -62,6 +62,12 @@ class TestEdge(unittest.TestCase):
         fake_node = Component()
         self.assertNotIn(fake_node.ln_id, self.edge)
 
+    def test_contains_component(self):
+        """Test the __contains__ method with Component items."""
+        self.assertIn(self.node1, self.edge)
+        self.assertIn(self.node2, self.edge)
+        self.assertNotIn(Component(), self.edge)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+import gc
+import unittest
+import weakref
+from lionagi.core.action.tool import Tool
+from lionagi.core.action.tool_manager import _schema_for, _cached_schema, func_to_tool
+from lionagi.tests.test_core.tool_funcs import f, g, p1, p2
+
+
+class Owner:
+
+    def method(self, x: int):
+        """
+        Return x.
+
+        Args:
+            x (int): the value
+        """
+        return x
+
+
+class TestSchemaCache(unittest.TestCase):
+
+    def test_bound_method_not_retained(self):
+        """Test that parsing a bound method's schema doesn't keep its owner alive."""
+        owner = Owner()
+        ref = weakref.ref(owner)
+        schema = _schema_for(owner.method, "google")
+        self.assertEqual(schema["function"]["name"], "method")
+        del owner
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_closure_not_cached(self):
+        """Test that per-call closures bypass the schema cache."""
+
+        def outer(y):
+            def inner(x: int):
+                """Add y to x."""
+                return x + y
+
+            return inner
+
+        _cached_schema.cache_clear()
+        _schema_for(outer(1), "google")
+        self.assertEqual(_cached_schema.cache_info().currsize, 0)
+
+
+class TestFuncToTool(unittest.TestCase):
+
+    def test_parsers_matched_to_functions(self):
+        """Test that each function gets the parser at the same position."""
+        tools = func_to_tool([f, g], [p1, p2])
+        self.assertEqual(len(tools), 2)
+        for tool, func, parser in zip(tools, [f, g], [p1, p2]):
+            self.assertIsInstance(tool, Tool)
+            self.assertIs(tool.function, func)
+            self.assertIs(tool.parser, parser)
+            self.assertEqual(tool.schema_["function"]["name"], func.__name__)
+
+    def test_single_parser_shared(self):
+        """Test that a single parser applies to every function."""
+        tools = func_to_tool([f, g], p1)
+        self.assertEqual([tool.parser for tool in tools], [p1, p1])
+
+    def test_tuple_inputs(self):
+        """Test that tuples of functions and parsers are treated like lists."""
+        tools = func_to_tool((f, g), (p1, p2))
+        self.assertEqual([tool.function for tool in tools], [f, g])
+        self.assertEqual([tool.parser for tool in tools], [p1, p2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+import lionagi as li
+from lionagi.core.action.tool_manager import func_to_tool
+from lionagi.core.unit.util import process_tools
+from lionagi.tests.test_core.tool_funcs import f, g
+
+
+class TestProcessTools(unittest.TestCase):
+
+    def setUp(self):
+        self.branch = li.Branch()
+
+    def test_single_tool(self):
+        tool = func_to_tool(f)[0]
+        process_tools(tool, self.branch)
+        self.assertEqual(list(self.branch.tool_manager.registry), ["f"])
+
+    def test_single_callable(self):
+        process_tools(f, self.branch)
+        self.assertEqual(list(self.branch.tool_manager.registry), ["f"])
+
+    def test_nested_list(self):
+        process_tools([f, [g]], self.branch)
+        self.assertEqual(list(self.branch.tool_manager.registry), ["f", "g"])
+
+    def test_list_with_bool(self):
+        process_tools([f, True, g], self.branch)
+        self.assertEqual(list(self.branch.tool_manager.registry), ["f", "g"])
+
+    def test_bool_flag(self):
+        process_tools(True, self.branch)
+        self.assertEqual(list(self.branch.tool_manager.registry), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+"""Module-level functions shared by the tool tests, so they are hashable and cacheable."""
+
+
+def f(x: int):
+    """
+    Return x.
+
+    Args:
+        x (int): the value
+    """
+    return x
+
+
+def g(y: int):
+    """
+    Return y.
+
+    Args:
+        y (int): the value
+    """
+    return y
+
+
+def p1(output):
+    return output
+
+
+def p2(output):
+    return output
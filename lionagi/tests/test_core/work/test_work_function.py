@@ -0,0 +1,51 @@
+import asyncio
+import unittest
+from lionagi.core.work.work import Work, WorkStatus
+from lionagi.core.work.work_function import WorkFunction
+
+
+async def double(x):
+    """Return x doubled."""
+    return x * 2
+
+
+class TestWorkFunction(unittest.TestCase):
+
+    def setUp(self):
+        self.work_function = WorkFunction(assignment="x -> y", function=double)
+        self.worklog = self.work_function.worklog
+
+    def add_work(self, status):
+        work = Work(async_task=double(1), status=status)
+        asyncio.run(self.worklog.append(work))
+        work.async_task.close()
+        return work
+
+    def test_empty_log(self):
+        """Test that an idle, empty log is not progressable."""
+        self.assertFalse(self.worklog.has_pending_work)
+        self.assertFalse(self.work_function.is_progressable())
+
+    def test_pending_work(self):
+        """Test that pending work makes the function progressable."""
+        self.add_work(WorkStatus.IN_PROGRESS)
+        self.add_work(WorkStatus.PENDING)
+        self.assertTrue(self.worklog.has_pending_work)
+        self.assertTrue(self.work_function.is_progressable())
+
+    def test_in_progress_only(self):
+        """Test that work already in progress doesn't count as pending."""
+        self.add_work(WorkStatus.IN_PROGRESS)
+        self.assertFalse(self.worklog.has_pending_work)
+        self.assertFalse(self.work_function.is_progressable())
+
+    def test_stopped(self):
+        """Test that a stopped log is not progressable even with pending work."""
+        self.add_work(WorkStatus.PENDING)
+        asyncio.run(self.worklog.stop())
+        self.assertTrue(self.worklog.has_pending_work)
+        self.assertFalse(self.work_function.is_progressable())
+
+
+if __name__ == "__main__":
+    unittest.main()
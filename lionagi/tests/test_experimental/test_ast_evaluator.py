@@ -0,0 +1,67 @@
+import ast
+import unittest
+import warnings
+from lionagi.experimental.evaluator.ast_evaluator import (
+    ASTEvaluator,
+    ASTEvaluationEngine,
+)
+
+
+class TestASTEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = ASTEvaluator()
+
+    def test_numeric_constant(self):
+        """Test comparison against a numeric constant."""
+        self.assertTrue(self.evaluator.evaluate("x > 1", {"x": 2}))
+        self.assertFalse(self.evaluator.evaluate("x > 1", {"x": 0}))
+
+    def test_string_constant(self):
+        """Test comparison against a string constant."""
+        self.assertTrue(self.evaluator.evaluate("name == 'lion'", {"name": "lion"}))
+        self.assertFalse(self.evaluator.evaluate("name == 'lion'", {"name": "cat"}))
+
+    def test_bool_constant(self):
+        """Test comparison against boolean constants."""
+        self.assertTrue(self.evaluator.evaluate("flag == True", {"flag": True}))
+        self.assertTrue(self.evaluator.evaluate("flag != False", {"flag": True}))
+        self.assertFalse(self.evaluator.evaluate("flag == True", {"flag": False}))
+
+    def test_none_constant(self):
+        """Test comparison against None."""
+        self.assertTrue(self.evaluator.evaluate("value == None", {}))
+        self.assertFalse(self.evaluator.evaluate("value == None", {"value": 1}))
+
+    def test_disallowed_operation(self):
+        """Test that unsupported nodes are rejected."""
+        with self.assertRaises(ValueError):
+            self.evaluator.evaluate("x + 1 > 2", {"x": 2})
+
+    def test_no_deprecation_warning(self):
+        """Test that constants are read without deprecated ast attributes."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            self.assertTrue(self.evaluator.evaluate("x < 1.5", {"x": 1}))
+            self.assertTrue(self.evaluator.evaluate("s == 'a'", {"s": "a"}))
+
+    def test_cache_keyed_by_operators(self):
+        """Test that a tree validated for one operator set isn't reused for another."""
+        self.assertTrue(self.evaluator.evaluate("x > 1", {"x": 2}))
+        restricted = ASTEvaluator()
+        del restricted.allowed_operators[ast.Gt]
+        with self.assertRaises(ValueError):
+            restricted.evaluate("x > 1", {"x": 2})
+
+
+class TestASTEvaluationEngine(unittest.TestCase):
+
+    def test_assign_comparison(self):
+        """Test that assignments store evaluated comparison results."""
+        engine = ASTEvaluationEngine()
+        engine.execute("result = 'a' == 'a'")
+        self.assertTrue(engine.variables["result"])
+
+
+if __name__ == "__main__":
+    unittest.main()